@@ -78,7 +78,7 @@ def example_version_management():
         print(f"New version: {new_version}")
         
         # Create tag
-        success, message = git.create_tag(
+        success, message, tag_name = git.create_tag(
             version=new_version,
             message="Release with new features"
         )
@@ -3,111 +3,653 @@
 Git Utility - A Python script to group and execute common git commands
 """
 
+import asyncio
+import configparser
+import functools
+import os
 import subprocess
+import shlex
 import sys
+import threading
 import argparse
-from typing import List, Optional
+from typing import List, NamedTuple, Optional
+
+try:
+    # Optional: in-process repository access via libgit2 skips the
+    # fork+exec entirely for read-only queries
+    import pygit2
+except ImportError:
+    pygit2 = None
+
+
+class _GitSession:
+    """
+    Long-lived shell subprocess used to dispatch commands
+
+    Spawning a process per git command costs a full fork+exec (5-7 ms on
+    Linux, far more on Windows). Keeping one `bash` open and writing
+    commands to its stdin amortizes that cost across the whole CLI
+    session; only git itself is exec'd per command. Replies are framed
+    with NUL sentinels carrying the exit status.
+    """
+
+    def __init__(self):
+        # The shell's own stdin is the command pipe, so commands run
+        # inside it would inherit that pipe and could never read a
+        # credential or passphrase prompt (or worse, would consume the
+        # command stream). Hand the session a duplicate of the real
+        # stdin on a spare descriptor and redirect every command to it.
+        self._stdin_fd = os.dup(0)
+        os.set_inheritable(self._stdin_fd, True)
+        self._proc = subprocess.Popen(
+            ["bash"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            bufsize=0,
+            pass_fds=(self._stdin_fd,)
+        )
+
+    def _drain_stderr(self, parts: list) -> None:
+        """Collect stderr up to its NUL sentinel"""
+        while True:
+            chunk = self._proc.stderr.read(8192)
+            if not chunk:
+                break
+            parts.append(chunk)
+            if b"\0" in chunk:
+                break
+
+    def run(self, command: List[str]) -> tuple:
+        """
+        Execute a command through the session shell
+
+        stderr is drained on a separate thread while this thread reads
+        stdout: reading the streams one after the other deadlocks as
+        soon as a command fills the stderr pipe (~64KB) before its
+        stdout sentinel is written.
+
+        Args:
+            command: List of command arguments
+
+        Returns:
+            Tuple of (stdout, stderr, returncode)
+        """
+        quoted = " ".join(shlex.quote(arg) for arg in command)
+        script = '{ %s ; } <&%d ; printf \'\\0%%d\\0\' "$?"; printf \'\\0\' >&2\n' % (
+            quoted, self._stdin_fd
+        )
+        self._proc.stdin.write(script.encode())
+        self._proc.stdin.flush()
+
+        # stdout ends with \0<returncode>\0, stderr with a bare \0
+        err_parts = []
+        drain = threading.Thread(target=self._drain_stderr, args=(err_parts,))
+        drain.start()
+
+        buf = b""
+        try:
+            while True:
+                chunk = self._proc.stdout.read(8192)
+                if not chunk:
+                    raise OSError("git session shell exited unexpectedly")
+                buf += chunk
+                if buf.endswith(b"\0"):
+                    stdout, sep, code = buf[:-1].rpartition(b"\0")
+                    if sep and code.isdigit():
+                        break
+        finally:
+            drain.join()
+
+        err = b"".join(err_parts)
+        sentinel = err.rfind(b"\0")
+        if sentinel != -1:
+            err = err[:sentinel]
+
+        return stdout, err, int(code)
+
+    def close(self) -> None:
+        """Shut down the session shell"""
+        try:
+            self._proc.stdin.close()
+            self._proc.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            self._proc.kill()
+        try:
+            os.close(self._stdin_fd)
+        except OSError:
+            pass
+
+
+class _Printer:
+    """
+    Buffered stdout writer
+
+    Collects output fragments and emits them in one write instead of a
+    syscall per print(); interleaved small writes are notably slow on
+    Windows consoles. Buffers bytes so captured command output can be
+    mirrored without decoding. Errors should bypass this and go
+    straight to stderr (flush first to keep ordering).
+    """
+
+    _FLUSH_AT = 4096
+
+    def __init__(self):
+        self._parts = []
+        self._size = 0
+
+    def write(self, text: str) -> None:
+        self.write_bytes(text.encode())
+
+    def write_bytes(self, data: bytes) -> None:
+        self._parts.append(data)
+        self._size += len(data)
+        if self._size >= self._FLUSH_AT:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._parts:
+            sys.stdout.flush()
+            sys.stdout.buffer.write(b"".join(self._parts))
+            sys.stdout.buffer.flush()
+            self._parts = []
+            self._size = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.flush()
+
+
+class RepoInfo(NamedTuple):
+    """Repository paths resolved from a single rev-parse call"""
+    toplevel: str
+    git_dir: str
+    cdup: str
 
 
 class GitUtil:
     """Git utility class for executing grouped git commands"""
 
+    def __init__(self):
+        self._session = None
+        self._session_failed = sys.platform == "win32"
+        self._git_dir_cache = False
+        self._pygit2_repo_cache = False
+
+    def close(self) -> None:
+        """Release the session shell, if one was started"""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
     @staticmethod
-    def run_command(command: List[str]) -> tuple:
+    def _run_direct(command: List[str]) -> tuple:
         """
-        Execute a shell command and return output and return code
-        
+        Execute a command in a dedicated subprocess
+
         Args:
             command: List of command arguments
-            
+
         Returns:
-            Tuple of (stdout, stderr, returncode)
+            Tuple of (stdout bytes, stderr bytes, returncode)
         """
+        kwargs = {}
+        if sys.platform == "win32":
+            # Python's close_fds=True default triggers a HANDLE scan
+            # on Windows that is measurably slow; we inherit no
+            # sensitive descriptors here
+            kwargs["close_fds"] = False
         try:
             result = subprocess.run(
                 command,
                 capture_output=True,
-                text=True,
-                check=False
+                check=False,
+                **kwargs
             )
             return result.stdout, result.stderr, result.returncode
+        except Exception as e:
+            return b"", str(e).encode(), 1
+
+    def run_command(self, command: List[str]) -> tuple:
+        """
+        Execute a shell command and return output and return code
+
+        Output is returned as raw bytes; most callers only mirror it
+        to the terminal or check the return code, so eagerly decoding
+        every stream would be wasted work. Use _run_str where the
+        output text is actually inspected.
+
+        Commands are dispatched through a lazily started session shell
+        (see _GitSession) when available, falling back to one
+        subprocess per command otherwise.
+
+        The command must be a sequence of arguments, never a string: a
+        string would flip subprocess into shell mode, whose parsing
+        adds milliseconds per call and changes quoting semantics.
+
+        Args:
+            command: List of command arguments
+
+        Returns:
+            Tuple of (stdout bytes, stderr bytes, returncode)
+        """
+        assert isinstance(command, (list, tuple)), \
+            "command must be an argument sequence, not a string"
+        if self._session is None and not self._session_failed:
+            try:
+                self._session = _GitSession()
+            except OSError:
+                self._session_failed = True
+        if self._session is not None:
+            try:
+                return self._session.run(command)
+            except OSError:
+                # Session shell died; don't retry it for this run
+                self._session = None
+                self._session_failed = True
+        return self._run_direct(command)
+
+    def _run_str(self, command: List[str]) -> tuple:
+        """
+        Execute a command and return its output decoded to text
+
+        Args:
+            command: List of command arguments
+
+        Returns:
+            Tuple of (stdout, stderr, returncode)
+        """
+        stdout, stderr, code = self.run_command(command)
+        return self._to_text(stdout), self._to_text(stderr), code
+
+    @staticmethod
+    def _to_text(data: bytes) -> str:
+        """Decode command output for user-facing formatting"""
+        return data.decode(errors="replace")
+
+    @staticmethod
+    def _write_out(data: bytes) -> None:
+        """Mirror raw command output to stdout without decoding"""
+        sys.stdout.flush()
+        sys.stdout.buffer.write(data)
+        sys.stdout.buffer.flush()
+
+    @staticmethod
+    def _run_passthrough(command: List[str]) -> int:
+        """
+        Execute a command with output going straight to the terminal
+
+        For commands whose output is only ever mirrored to the user,
+        capturing and decoding it into Python strings is wasted work;
+        leaving stdout/stderr alone lets git write directly to the
+        terminal's file descriptors.
+
+        Args:
+            command: List of command arguments
+
+        Returns:
+            The command's return code
+        """
+        try:
+            return subprocess.run(command, check=False).returncode
+        except Exception as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+
+    @staticmethod
+    async def _run_async(command: List[str]) -> tuple:
+        """
+        Execute a command as an asyncio subprocess
+
+        Used by read-only paths whose commands have no ordering
+        dependency, so several git processes can run concurrently and
+        wall-clock time drops from the sum of their latencies to the
+        max.
+
+        Args:
+            command: List of command arguments
+
+        Returns:
+            Tuple of (stdout, stderr, returncode)
+        """
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *command,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+            stdout, stderr = await proc.communicate()
+            return (
+                stdout.decode(errors="replace"),
+                stderr.decode(errors="replace"),
+                proc.returncode
+            )
         except Exception as e:
             return "", str(e), 1
 
+    @functools.cached_property
+    def repo_info(self) -> Optional[RepoInfo]:
+        """
+        Repository paths from one combined rev-parse call
+
+        --show-toplevel, --git-common-dir and --show-cdup are resolved
+        together and cached, so every consumer shares a single git
+        subprocess instead of each spawning its own rev-parse.
+
+        Returns:
+            RepoInfo, or None if not inside a git repository
+        """
+        stdout, stderr, code = self._run_str(
+            ["git", "rev-parse", "--show-toplevel", "--git-common-dir", "--show-cdup"]
+        )
+        if code != 0:
+            return None
+        lines = stdout.splitlines()
+        lines += [""] * (3 - len(lines))
+        return RepoInfo(lines[0], lines[1], lines[2])
+
+    def _pygit2_repo(self):
+        """
+        Open the repository via pygit2 when available, caching it
+
+        Returns:
+            pygit2.Repository, or None when pygit2 is not installed or
+            the repository could not be opened
+        """
+        if self._pygit2_repo_cache is not False:
+            return self._pygit2_repo_cache
+        self._pygit2_repo_cache = None
+        if pygit2 is not None:
+            try:
+                self._pygit2_repo_cache = pygit2.Repository(".")
+            except Exception:
+                pass
+        return self._pygit2_repo_cache
+
+    def _pygit2_branch_listing(self) -> Optional[tuple]:
+        """
+        Build local/remote branch listings in-process via pygit2
+
+        Returns:
+            Tuple of (local, remote) listing strings, or None if the
+            repository can't be read this way (caller should fall back
+            to git)
+        """
+        repo = self._pygit2_repo()
+        if repo is None:
+            return None
+        try:
+            current = "" if repo.head_is_detached else repo.head.shorthand
+            local = []
+            for name in sorted(repo.branches.local):
+                commit = repo.branches.local[name].peel()
+                marker = "*" if name == current else " "
+                summary = commit.message.splitlines()[0] if commit.message else ""
+                local.append(f"{marker} {name} {str(commit.id)[:7]} {summary}")
+            remote = [f"  {name}" for name in sorted(repo.branches.remote)]
+            return "\n".join(local), "\n".join(remote)
+        except Exception:
+            return None
+
+    def _git_dir(self) -> Optional[str]:
+        """
+        Locate the repository's .git directory, caching the result
+
+        Walks up from the current directory looking for .git, following
+        gitfile indirection for worktrees and submodules. Avoids
+        spawning `git rev-parse` for a value that cannot change within
+        a single run.
+
+        Returns:
+            Path to the .git directory, or None if not in a repository
+        """
+        if self._git_dir_cache is not False:
+            return self._git_dir_cache
+        self._git_dir_cache = None
+        path = os.getcwd()
+        while True:
+            candidate = os.path.join(path, ".git")
+            if os.path.isdir(candidate):
+                self._git_dir_cache = candidate
+                break
+            if os.path.isfile(candidate):
+                # Worktree/submodule gitfile: "gitdir: <path>"
+                try:
+                    with open(candidate) as f:
+                        line = f.read().strip()
+                except OSError:
+                    break
+                if line.startswith("gitdir: "):
+                    self._git_dir_cache = os.path.normpath(
+                        os.path.join(path, line[len("gitdir: "):])
+                    )
+                break
+            parent = os.path.dirname(path)
+            if parent == path:
+                # Unusual layouts (e.g. GIT_DIR set elsewhere): ask
+                # git itself via the shared rev-parse cache
+                info = self.repo_info
+                if info is not None and info.git_dir:
+                    self._git_dir_cache = os.path.abspath(info.git_dir)
+                break
+            path = parent
+        return self._git_dir_cache
+
+    def _current_branch(self) -> Optional[str]:
+        """
+        Read the current branch from .git/HEAD without spawning git
+
+        Returns:
+            Branch name, "" when HEAD is detached, or None if the file
+            could not be read (caller should fall back to git)
+        """
+        repo = self._pygit2_repo()
+        if repo is not None:
+            try:
+                return "" if repo.head_is_detached else repo.head.shorthand
+            except Exception:
+                pass
+        git_dir = self._git_dir()
+        if not git_dir:
+            return None
+        try:
+            with open(os.path.join(git_dir, "HEAD")) as f:
+                head = f.read().strip()
+        except OSError:
+            return None
+        if head.startswith("ref: refs/heads/"):
+            return head[len("ref: refs/heads/"):]
+        if head.startswith("ref: "):
+            return None
+        return ""
+
+    def _remotes(self) -> Optional[str]:
+        """
+        Parse remotes from .git/config, mirroring `git remote -v`
+
+        Returns:
+            Remote listing, or None if the config could not be parsed
+            (caller should fall back to git)
+        """
+        git_dir = self._git_dir()
+        if not git_dir:
+            return None
+        config = configparser.ConfigParser(strict=False)
+        try:
+            if not config.read(os.path.join(git_dir, "config")):
+                return None
+        except (configparser.Error, OSError):
+            return None
+        lines = []
+        for section in config.sections():
+            if section.startswith('remote "') and section.endswith('"'):
+                name = section[len('remote "'):-1]
+                url = config.get(section, "url", fallback=None)
+                if url:
+                    push_url = config.get(section, "pushurl", fallback=url)
+                    lines.append(f"{name}\t{url} (fetch)")
+                    lines.append(f"{name}\t{push_url} (push)")
+        return "\n".join(lines)
+
     def status_info(self) -> None:
         """Display repository status and information"""
-        print("=== Repository Status ===")
-        commands = [
-            (["git", "status", "--short"], "Short status"),
-            (["git", "branch", "--show-current"], "Current branch"),
-            (["git", "remote", "-v"], "Remote repositories"),
-        ]
-        
-        for cmd, description in commands:
-            print(f"\n{description}:")
-            stdout, stderr, code = self.run_command(cmd)
+        with _Printer() as out:
+            out.write("=== Repository Status ===\n")
+
+            # Only the short status has no cheap filesystem equivalent;
+            # branch and remotes are read directly from .git/
+            out.write("\nShort status:\n")
+            stdout, stderr, code = self.run_command(["git", "status", "--short"])
             if code == 0:
-                print(stdout if stdout else "(no output)")
+                out.write_bytes(stdout if stdout else b"(no output)\n")
             else:
-                print(f"Error: {stderr}")
+                out.flush()
+                print(f"Error: {self._to_text(stderr)}", file=sys.stderr)
+
+            out.write("\nCurrent branch:\n")
+            branch = self._current_branch()
+            if branch is None:
+                stdout, stderr, code = self._run_str(["git", "branch", "--show-current"])
+                branch = stdout.strip() if code == 0 else None
+            out.write(f"{branch}\n" if branch else "(no output)\n")
+
+            out.write("\nRemote repositories:\n")
+            remotes = self._remotes()
+            if remotes is None:
+                stdout, stderr, code = self._run_str(["git", "remote", "-v"])
+                remotes = stdout if code == 0 else None
+            out.write(f"{remotes}\n" if remotes else "(no output)\n")
+
+    def _suggest_fsmonitor(self) -> None:
+        """
+        Suggest filesystem-monitor config, at most once per repository
+
+        `git add .` rescans the entire working tree; on large repos
+        core.fsmonitor and core.untrackedCache cut that scan down to
+        the files that actually changed. A marker file in .git/
+        records that the suggestion was made, so the hint neither nags
+        on every commit nor costs a `git config` subprocess after the
+        first one.
+        """
+        git_dir = self._git_dir()
+        if not git_dir:
+            return
+        marker = os.path.join(git_dir, "git-util-fsmonitor-hint")
+        if os.path.exists(marker):
+            return
+        stdout, stderr, code = self._run_str(["git", "config", "--get", "core.fsmonitor"])
+        if code != 0 or not stdout.strip():
+            print(
+                "Hint: 'git config core.fsmonitor true' and "
+                "'git config core.untrackedCache true' can speed up "
+                "working-tree scans on large repositories",
+                file=sys.stderr
+            )
+        try:
+            with open(marker, "w"):
+                pass
+        except OSError:
+            pass
 
-    def quick_commit(self, message: str) -> None:
+    def quick_commit(self, message: str, only_tracked: bool = False) -> None:
         """Add all changes and commit with a message"""
         print("=== Quick Commit ===")
-        
-        # Add all changes
+
+        # commit -a stages modified/deleted tracked files itself, so
+        # the tracked-only path needs just one subprocess and one
+        # index write instead of a separate add -u
+        if only_tracked:
+            print(f"\nCommitting tracked changes with message: '{message}'")
+            stdout, stderr, code = self.run_command(["git", "commit", "-a", "-m", message])
+            if code == 0:
+                self._write_out(stdout)
+            else:
+                print(f"Error committing: {self._to_text(stderr)}")
+            return
+
+        # The default path must stage untracked files too, which
+        # commit -a can't do
         print("\nAdding all changes...")
+        self._suggest_fsmonitor()
         stdout, stderr, code = self.run_command(["git", "add", "."])
         if code != 0:
-            print(f"Error adding files: {stderr}")
+            print(f"Error adding files: {self._to_text(stderr)}")
             return
         
         # Commit
         print(f"\nCommitting with message: '{message}'")
         stdout, stderr, code = self.run_command(["git", "commit", "-m", message])
         if code == 0:
-            print(stdout)
+            self._write_out(stdout)
         else:
-            print(f"Error committing: {stderr}")
+            print(f"Error committing: {self._to_text(stderr)}")
 
-    def sync(self) -> None:
+    async def sync(self) -> None:
         """Pull latest changes and push local changes"""
         print("=== Sync Repository ===")
-        
-        # Pull
-        print("\nPulling latest changes...")
-        stdout, stderr, code = self.run_command(["git", "pull"])
+
+        # git pull is fetch + merge under the hood; running fetch
+        # ourselves lets the upstream lookup overlap with the network
+        # round-trip and gives each stage its own error message
+        print("\nFetching latest changes...")
+        fetch_result, upstream_result = await asyncio.gather(
+            self._run_async(["git", "fetch"]),
+            self._run_async(["git", "rev-parse", "--abbrev-ref", "@{u}"]),
+        )
+        stdout, stderr, code = fetch_result
+        if code != 0:
+            print(f"Fetch error: {stderr}")
+            return
+
+        upstream = upstream_result[0].strip() if upstream_result[2] == 0 else ""
+        print(f"\nMerging {upstream if upstream else 'fetched changes'}...")
+        stdout, stderr, code = self.run_command(["git", "merge", "--ff-only", "FETCH_HEAD"])
         if code == 0:
-            print(stdout)
+            self._write_out(stdout)
         else:
-            print(f"Pull error: {stderr}")
+            print(f"Merge error: {self._to_text(stderr)}")
             return
-        
-        # Push
+
+        # --atomic: if several refs are pushed, all update or none do
         print("\nPushing local changes...")
-        stdout, stderr, code = self.run_command(["git", "push"])
+        stdout, stderr, code = self.run_command(["git", "push", "--atomic"])
         if code == 0:
-            print(stdout if stdout else "Push successful")
+            if stdout:
+                self._write_out(stdout)
+            else:
+                print("Push successful")
         else:
-            print(f"Push error: {stderr}")
+            print(f"Push error: {self._to_text(stderr)}")
 
-    def branch_info(self) -> None:
+    async def branch_info(self) -> None:
         """Display branch information"""
-        print("=== Branch Information ===")
-        
-        print("\nLocal branches:")
-        stdout, stderr, code = self.run_command(["git", "branch", "-v"])
-        if code == 0:
-            print(stdout)
-        else:
-            print(f"Error: {stderr}")
-        
-        print("\nRemote branches:")
-        stdout, stderr, code = self.run_command(["git", "branch", "-r"])
-        if code == 0:
-            print(stdout)
-        else:
-            print(f"Error: {stderr}")
+        with _Printer() as out:
+            out.write("=== Branch Information ===\n")
+
+            listing = self._pygit2_branch_listing()
+            if listing is not None:
+                local, remote = listing
+                out.write(f"\nLocal branches:\n{local}\n")
+                out.write(f"\nRemote branches:\n{remote}\n")
+                return
+
+            commands = [
+                (["git", "branch", "-v"], "Local branches"),
+                (["git", "branch", "-r"], "Remote branches"),
+            ]
+
+            results = await asyncio.gather(
+                *(self._run_async(cmd) for cmd, _ in commands)
+            )
+            for (cmd, description), (stdout, stderr, code) in zip(commands, results):
+                out.write(f"\n{description}:\n")
+                if code == 0:
+                    out.write(f"{stdout}\n")
+                else:
+                    out.flush()
+                    print(f"Error: {stderr}", file=sys.stderr)
 
     def create_branch(self, branch_name: str, checkout: bool = True) -> None:
         """Create and optionally checkout a new branch"""
@@ -121,9 +663,9 @@ class GitUtil:
         if code == 0:
             print(f"Branch '{branch_name}' created successfully")
             if stdout:
-                print(stdout)
+                self._write_out(stdout)
         else:
-            print(f"Error: {stderr}")
+            print(f"Error: {self._to_text(stderr)}")
 
     def switch_branch(self, branch_name: str) -> None:
         """Switch to a different branch"""
@@ -133,24 +675,21 @@ class GitUtil:
         if code == 0:
             print(f"Switched to branch '{branch_name}'")
             if stdout:
-                print(stdout)
+                self._write_out(stdout)
         else:
-            print(f"Error: {stderr}")
+            print(f"Error: {self._to_text(stderr)}")
 
     def log_history(self, limit: int = 10) -> None:
         """Display commit history"""
         print(f"=== Recent Commits (last {limit}) ===\n")
-        
-        stdout, stderr, code = self.run_command([
-            "git", "log", 
-            f"--oneline", 
+        sys.stdout.flush()  # keep the header ahead of git's own writes
+
+        self._run_passthrough([
+            "git", "log",
+            "--oneline",
             f"-{limit}",
             "--decorate"
         ])
-        if code == 0:
-            print(stdout)
-        else:
-            print(f"Error: {stderr}")
 
     def undo_last_commit(self, keep_changes: bool = True) -> None:
         """Undo the last commit"""
@@ -164,7 +703,7 @@ class GitUtil:
             print("Last commit undone, changes discarded")
         
         if code != 0:
-            print(f"Error: {stderr}")
+            print(f"Error: {self._to_text(stderr)}")
 
     def discard_changes(self, file_path: Optional[str] = None) -> None:
         """Discard changes in working directory"""
@@ -178,7 +717,7 @@ class GitUtil:
         if code == 0:
             print("Changes discarded successfully")
         else:
-            print(f"Error: {stderr}")
+            print(f"Error: {self._to_text(stderr)}")
 
     def stash_save(self, message: Optional[str] = None) -> None:
         """Save current changes to stash"""
@@ -191,9 +730,12 @@ class GitUtil:
         
         stdout, stderr, code = self.run_command(cmd)
         if code == 0:
-            print(stdout if stdout else "Changes stashed successfully")
+            if stdout:
+                self._write_out(stdout)
+            else:
+                print("Changes stashed successfully")
         else:
-            print(f"Error: {stderr}")
+            print(f"Error: {self._to_text(stderr)}")
 
     def stash_pop(self) -> None:
         """Apply and remove the most recent stash"""
@@ -201,9 +743,12 @@ class GitUtil:
         
         stdout, stderr, code = self.run_command(["git", "stash", "pop"])
         if code == 0:
-            print(stdout if stdout else "Stash applied successfully")
+            if stdout:
+                self._write_out(stdout)
+            else:
+                print("Stash applied successfully")
         else:
-            print(f"Error: {stderr}")
+            print(f"Error: {self._to_text(stderr)}")
 
     def stash_list(self) -> None:
         """List all stashes"""
@@ -211,17 +756,70 @@ class GitUtil:
         
         stdout, stderr, code = self.run_command(["git", "stash", "list"])
         if code == 0:
-            print(stdout if stdout else "No stashes found")
+            if stdout:
+                self._write_out(stdout)
+            else:
+                print("No stashes found")
         else:
-            print(f"Error: {stderr}")
+            print(f"Error: {self._to_text(stderr)}")
 
 
-def main():
-    """Main entry point for the git utility"""
-    parser = argparse.ArgumentParser(
-        description="Git Utility - Group and execute common git commands",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+def _commit_args(parser) -> None:
+    parser.add_argument("message", help="Commit message")
+    parser.add_argument("--tracked", action="store_true",
+                        help="Only stage tracked files (skips the untracked-file scan)")
+
+
+def _create_branch_args(parser) -> None:
+    parser.add_argument("name", help="Branch name")
+    parser.add_argument("--no-checkout", action="store_true",
+                        help="Don't checkout the new branch")
+
+
+def _switch_args(parser) -> None:
+    parser.add_argument("name", help="Branch name")
+
+
+def _log_args(parser) -> None:
+    parser.add_argument("-n", "--number", type=int, default=10,
+                        help="Number of commits to show (default: 10)")
+
+
+def _undo_args(parser) -> None:
+    parser.add_argument("--hard", action="store_true",
+                        help="Discard changes (default: keep changes)")
+
+
+def _discard_args(parser) -> None:
+    parser.add_argument("file", nargs="?", help="Specific file to discard (default: all)")
+
+
+def _stash_save_args(parser) -> None:
+    parser.add_argument("-m", "--message", help="Stash message")
+
+
+# Command registry: name -> (help text, argument setup or None).
+# main() builds a parser for just the requested command so a normal
+# invocation never pays for constructing the full subparser tree.
+COMMANDS = {
+    "status": ("Display repository status and information", None),
+    "commit": ("Add all changes and commit", _commit_args),
+    "sync": ("Pull latest changes and push local changes", None),
+    "branch": ("Display branch information", None),
+    "create-branch": ("Create a new branch", _create_branch_args),
+    "switch": ("Switch to a different branch", _switch_args),
+    "log": ("Display commit history", _log_args),
+    "undo": ("Undo last commit", _undo_args),
+    "discard": ("Discard changes in working directory", _discard_args),
+    "stash-save": ("Save changes to stash", _stash_save_args),
+    "stash-pop": ("Apply and remove most recent stash", None),
+    "stash-list": ("List all stashes", None),
+}
+
+
+def _epilog() -> str:
+    """Build the help epilog; only ever needed on the --help path"""
+    return """
 Examples:
   %(prog)s status              # Show repository status and info
   %(prog)s commit "message"    # Quick commit all changes
@@ -233,91 +831,118 @@ Examples:
   %(prog)s stash-save          # Stash current changes
   %(prog)s stash-pop           # Apply most recent stash
         """
+
+
+def _build_full_parser() -> argparse.ArgumentParser:
+    """Build the complete parser, for --help and unknown commands"""
+    parser = argparse.ArgumentParser(
+        description="Git Utility - Group and execute common git commands",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_epilog()
     )
-    
+
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
-    
-    # Status command
-    subparsers.add_parser("status", help="Display repository status and information")
-    
-    # Commit command
-    commit_parser = subparsers.add_parser("commit", help="Add all changes and commit")
-    commit_parser.add_argument("message", help="Commit message")
-    
-    # Sync command
-    subparsers.add_parser("sync", help="Pull latest changes and push local changes")
-    
-    # Branch command
-    subparsers.add_parser("branch", help="Display branch information")
-    
-    # Create branch command
-    create_branch_parser = subparsers.add_parser("create-branch", help="Create a new branch")
-    create_branch_parser.add_argument("name", help="Branch name")
-    create_branch_parser.add_argument("--no-checkout", action="store_true", 
-                                      help="Don't checkout the new branch")
-    
-    # Switch branch command
-    switch_parser = subparsers.add_parser("switch", help="Switch to a different branch")
-    switch_parser.add_argument("name", help="Branch name")
-    
-    # Log command
-    log_parser = subparsers.add_parser("log", help="Display commit history")
-    log_parser.add_argument("-n", "--number", type=int, default=10, 
-                           help="Number of commits to show (default: 10)")
-    
-    # Undo command
-    undo_parser = subparsers.add_parser("undo", help="Undo last commit")
-    undo_parser.add_argument("--hard", action="store_true", 
-                            help="Discard changes (default: keep changes)")
-    
-    # Discard command
-    discard_parser = subparsers.add_parser("discard", help="Discard changes in working directory")
-    discard_parser.add_argument("file", nargs="?", help="Specific file to discard (default: all)")
-    
-    # Stash commands
-    stash_save_parser = subparsers.add_parser("stash-save", help="Save changes to stash")
-    stash_save_parser.add_argument("-m", "--message", help="Stash message")
-    
-    subparsers.add_parser("stash-pop", help="Apply and remove most recent stash")
-    subparsers.add_parser("stash-list", help="List all stashes")
-    
-    args = parser.parse_args()
-    
+
+    for name, (help_text, setup) in COMMANDS.items():
+        sub = subparsers.add_parser(name, help=help_text)
+        if setup is not None:
+            setup(sub)
+
+    return parser
+
+
+def _build_command_parser(command: str) -> argparse.ArgumentParser:
+    """Build a minimal parser for a single known command"""
+    parser = argparse.ArgumentParser()
+    subparsers = parser.add_subparsers(dest="command")
+
+    help_text, setup = COMMANDS[command]
+    sub = subparsers.add_parser(command, help=help_text)
+    if setup is not None:
+        setup(sub)
+
+    return parser
+
+
+# Commands that take no options can skip argparse entirely when
+# invoked bare; parser construction is a measurable slice of startup
+# for a CLI this small
+_NO_ARG_COMMANDS = frozenset({"status", "sync", "branch", "stash-pop", "stash-list"})
+
+
+def main():
+    """Main entry point for the git utility"""
+    argv = sys.argv[1:]
+
+    if len(argv) == 1 and argv[0] in _NO_ARG_COMMANDS:
+        # Fastest path: nothing to parse
+        parser = None
+        args = argparse.Namespace(command=argv[0])
+    else:
+        if argv and argv[0] in COMMANDS:
+            # Fast path: only register the command actually being run
+            parser = _build_command_parser(argv[0])
+        else:
+            # --help, no command, or unknown command
+            parser = _build_full_parser()
+        args = parser.parse_args()
+
     if not args.command:
         parser.print_help()
         sys.exit(1)
-    
+
     git_util = GitUtil()
-    
-    # Execute the appropriate command
-    if args.command == "status":
-        git_util.status_info()
-    elif args.command == "commit":
-        git_util.quick_commit(args.message)
-    elif args.command == "sync":
-        git_util.sync()
-    elif args.command == "branch":
-        git_util.branch_info()
-    elif args.command == "create-branch":
-        git_util.create_branch(args.name, not args.no_checkout)
-    elif args.command == "switch":
-        git_util.switch_branch(args.name)
-    elif args.command == "log":
-        git_util.log_history(args.number)
-    elif args.command == "undo":
-        git_util.undo_last_commit(not args.hard)
-    elif args.command == "discard":
-        git_util.discard_changes(args.file)
-    elif args.command == "stash-save":
-        git_util.stash_save(args.message)
-    elif args.command == "stash-pop":
-        git_util.stash_pop()
-    elif args.command == "stash-list":
-        git_util.stash_list()
-    else:
+
+    try:
+        _dispatch(git_util, args, parser)
+    except BrokenPipeError:
+        # Downstream consumer (e.g. `... | head`) closed the pipe;
+        # stop quietly instead of tracebacking. Point stdout at
+        # /dev/null so the interpreter's exit-time flush doesn't
+        # raise again.
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        sys.exit(0)
+    finally:
+        git_util.close()
+
+
+def _run_async_command(coro) -> None:
+    """Drive an async command, preferring uvloop when installed"""
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    asyncio.run(coro)
+
+
+# Each handler receives the GitUtil instance and the parsed namespace
+HANDLERS = {
+    "status": lambda g, a: g.status_info(),
+    "commit": lambda g, a: g.quick_commit(a.message, only_tracked=a.tracked),
+    "sync": lambda g, a: _run_async_command(g.sync()),
+    "branch": lambda g, a: _run_async_command(g.branch_info()),
+    "create-branch": lambda g, a: g.create_branch(a.name, not a.no_checkout),
+    "switch": lambda g, a: g.switch_branch(a.name),
+    "log": lambda g, a: g.log_history(a.number),
+    "undo": lambda g, a: g.undo_last_commit(not a.hard),
+    "discard": lambda g, a: g.discard_changes(a.file),
+    "stash-save": lambda g, a: g.stash_save(a.message),
+    "stash-pop": lambda g, a: g.stash_pop(),
+    "stash-list": lambda g, a: g.stash_list(),
+}
+
+
+def _dispatch(git_util: GitUtil, args, parser) -> None:
+    """Execute the parsed command"""
+    handler = HANDLERS.get(args.command)
+    if handler is None:
         print(f"Unknown command: {args.command}")
-        parser.print_help()
+        if parser is not None:
+            parser.print_help()
         sys.exit(1)
+    handler(git_util, args)
 
 
 if __name__ == "__main__":
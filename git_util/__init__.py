@@ -2,6 +2,6 @@
 
 __version__ = "0.1.0"
 
-from .git_operations import GitUtil
+from .git_operations import GitUtil, run_on_repos
 
-__all__ = ["GitUtil"]
+__all__ = ["GitUtil", "run_on_repos"]
@@ -2,256 +2,353 @@
 
 import argparse
 import sys
-from .git_operations import GitUtil, CommitType, VersionBump
 
 
-def main():
-    """Main CLI entry point."""
-    parser = argparse.ArgumentParser(
-        description="Git utility for conventional commits and semantic versioning",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  # Add all files, commit with conventional message, and push
-  git-util commit -t feat -d "add new feature" --push
-  
-  # Add specific files and commit
-  git-util commit -t fix -d "fix bug" -f file1.py file2.py
-  
-  # Commit with scope and body
-  git-util commit -t feat -d "add login" -s auth -b "Detailed description"
-  
-  # Create a tag and push
-  git-util tag -b minor -m "Release v0.2.0"
-  
-  # Full workflow: add, commit, tag, and push
-  git-util commit -t feat -d "new feature" --push --tag minor
-"""
-    )
-    
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
-    
-    # Add command
-    add_parser = subparsers.add_parser("add", help="Add files to staging area")
-    add_parser.add_argument(
+# Choice lists for the commit/tag parsers. They're constants, but the
+# enums live in git_operations, which stays unimported on paths that
+# never build those parsers -- so compute them once on first use
+# rather than at module load.
+_COMMIT_TYPES = None
+_BUMP_TYPES = None
+
+
+def _choice_lists():
+    global _COMMIT_TYPES, _BUMP_TYPES
+    if _COMMIT_TYPES is None:
+        from .git_operations import CommitType, VersionBump
+        _COMMIT_TYPES = tuple(ct.value for ct in CommitType)
+        _BUMP_TYPES = tuple(vb.value for vb in VersionBump)
+    return _COMMIT_TYPES, _BUMP_TYPES
+
+
+def _add_args(parser):
+    parser.add_argument(
         "files",
         nargs="*",
         help="Files to add (default: all files)"
     )
-    
-    # Commit command
-    commit_parser = subparsers.add_parser(
-        "commit",
-        help="Create a conventional commit"
-    )
-    commit_parser.add_argument(
+
+
+def _commit_args(parser):
+    commit_types, bump_types = _choice_lists()
+
+    parser.add_argument(
         "-t", "--type",
         required=True,
-        choices=[ct.value for ct in CommitType],
+        choices=commit_types,
         help="Commit type"
     )
-    commit_parser.add_argument(
+    parser.add_argument(
         "-d", "--description",
         required=True,
         help="Short description of changes"
     )
-    commit_parser.add_argument(
+    parser.add_argument(
         "-s", "--scope",
         help="Scope of changes"
     )
-    commit_parser.add_argument(
+    parser.add_argument(
         "-b", "--body",
         help="Detailed description"
     )
-    commit_parser.add_argument(
+    parser.add_argument(
         "--breaking",
         action="store_true",
         help="Mark as breaking change"
     )
-    commit_parser.add_argument(
+    parser.add_argument(
         "--footer",
         help="Footer (e.g., issue references)"
     )
-    commit_parser.add_argument(
+    parser.add_argument(
         "-f", "--files",
         nargs="*",
-        help="Files to add before committing (default: all files)"
+        help="Files to add before committing (bare -f adds all; "
+             "omit to commit only what is already staged)"
     )
-    commit_parser.add_argument(
+    parser.add_argument(
         "--push",
         action="store_true",
         help="Push after committing"
     )
-    commit_parser.add_argument(
+    parser.add_argument(
         "--tag",
-        choices=[vb.value for vb in VersionBump],
+        choices=bump_types,
         help="Create and push tag with version bump"
     )
-    commit_parser.add_argument(
+    parser.add_argument(
         "--remote",
         default="origin",
         help="Remote name (default: origin)"
     )
-    commit_parser.add_argument(
+    parser.add_argument(
         "--branch",
         help="Branch name (default: current branch)"
     )
-    
-    # Tag command
-    tag_parser = subparsers.add_parser(
-        "tag",
-        help="Create a semantic version tag"
-    )
-    tag_parser.add_argument(
+
+
+def _tag_args(parser):
+    _, bump_types = _choice_lists()
+
+    parser.add_argument(
         "-b", "--bump",
         required=True,
-        choices=[vb.value for vb in VersionBump],
+        choices=bump_types,
         help="Version bump type"
     )
-    tag_parser.add_argument(
+    parser.add_argument(
         "-m", "--message",
         help="Tag message"
     )
-    tag_parser.add_argument(
+    parser.add_argument(
         "--push",
         action="store_true",
         help="Push tag after creating"
     )
-    tag_parser.add_argument(
+    parser.add_argument(
         "--remote",
         default="origin",
         help="Remote name (default: origin)"
     )
-    
-    # Push command
-    push_parser = subparsers.add_parser(
-        "push",
-        help="Push changes to remote"
-    )
-    push_parser.add_argument(
+
+
+def _push_args(parser):
+    parser.add_argument(
         "--remote",
         default="origin",
         help="Remote name (default: origin)"
     )
-    push_parser.add_argument(
+    parser.add_argument(
         "--branch",
         help="Branch name (default: current branch)"
     )
-    push_parser.add_argument(
+    parser.add_argument(
         "--tags",
         action="store_true",
         help="Push tags"
     )
-    
-    args = parser.parse_args()
-    
+
+
+# Command registry: name -> (help text, argument setup). main() builds
+# a parser for just the requested command, so a normal invocation never
+# constructs the full subparser tree (or imports git_operations for
+# commands that don't need the enums).
+COMMANDS = {
+    "add": ("Add files to staging area", _add_args),
+    "commit": ("Create a conventional commit", _commit_args),
+    "tag": ("Create a semantic version tag", _tag_args),
+    "push": ("Push changes to remote", _push_args),
+}
+
+
+def _epilog():
+    """Build the help epilog; only ever needed on the --help path."""
+    return """
+Examples:
+  # Add all files, commit with conventional message, and push
+  git-util commit -t feat -d "add new feature" --push
+
+  # Add specific files and commit
+  git-util commit -t fix -d "fix bug" -f file1.py file2.py
+
+  # Commit with scope and body
+  git-util commit -t feat -d "add login" -s auth -b "Detailed description"
+
+  # Create a tag and push
+  git-util tag -b minor -m "Release v0.2.0"
+
+  # Full workflow: add, commit, tag, and push
+  git-util commit -t feat -d "new feature" --push --tag minor
+"""
+
+
+def _build_full_parser():
+    """Build the complete parser, for --help and unknown commands."""
+    parser = argparse.ArgumentParser(
+        description="Git utility for conventional commits and semantic versioning",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_epilog()
+    )
+
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+
+    for name, (help_text, setup) in COMMANDS.items():
+        setup(subparsers.add_parser(name, help=help_text))
+
+    return parser
+
+
+def _build_command_parser(command):
+    """Build a minimal parser for a single known command."""
+    parser = argparse.ArgumentParser()
+    subparsers = parser.add_subparsers(dest="command")
+
+    help_text, setup = COMMANDS[command]
+    setup(subparsers.add_parser(command, help=help_text))
+
+    return parser
+
+
+# Bare invocations of these commands need no parsing at all; the
+# namespace defaults mirror each subparser's declared defaults
+_BARE_DEFAULTS = {
+    "add": {"files": []},
+    "push": {"remote": "origin", "branch": None, "tags": False},
+}
+
+
+def _cmd_add(git_util, args):
+    """Handle the add command."""
+    files = args.files if args.files else None
+    success, message = git_util.add_files(files)
+    print(message)
+    sys.exit(0 if success else 1)
+
+
+def _cmd_commit(git_util, args):
+    """Handle the commit command."""
+    # Add files only when -f was given: argparse yields None when the
+    # flag is absent, and a bare -f (empty list) means "add all".
+    # Omitting -f commits what is already staged without paying for a
+    # git add working-tree scan.
+    if args.files is not None:
+        success, message = git_util.add_files(args.files or None)
+        if not success:
+            print(f"Error: {message}", file=sys.stderr)
+            sys.exit(1)
+        print(message)
+
+    # Create commit; argparse choices already validated the type
+    # string, so pass it straight through without the Enum round trip
+    success, message = git_util.create_conventional_commit(
+        commit_type=args.type,
+        description=args.description,
+        scope=args.scope,
+        body=args.body,
+        breaking=args.breaking,
+        footer=args.footer
+    )
+
+    if not success:
+        print(f"Error: {message}", file=sys.stderr)
+        sys.exit(1)
+    print(message)
+
+    # Create tag if requested
+    if args.tag:
+        from .git_operations import VersionBump
+
+        bump_type = VersionBump(args.tag)
+        success, message = git_util.auto_tag_and_push(
+            bump_type=bump_type,
+            remote=args.remote,
+            branch=args.branch,
+            tag_message=args.description
+        )
+        if not success:
+            print(f"Error: {message}", file=sys.stderr)
+            sys.exit(1)
+        print(message)
+    elif args.push:
+        # Push without tag
+        success, message = git_util.push_changes(
+            remote=args.remote,
+            branch=args.branch,
+            push_tags=False
+        )
+        if not success:
+            print(f"Error: {message}", file=sys.stderr)
+            sys.exit(1)
+        print(message)
+
+
+def _cmd_tag(git_util, args):
+    """Handle the tag command."""
+    from .git_operations import VersionBump
+
+    bump_type = VersionBump(args.bump)
+
+    # Get latest tag and bump version
+    latest_tag = git_util.get_latest_tag()
+    if latest_tag:
+        version = git_util.parse_version(latest_tag)
+        if not version:
+            print(f"Error: Failed to parse version from tag: {latest_tag}", file=sys.stderr)
+            sys.exit(1)
+    else:
+        version = (0, 0, 0)
+
+    new_version = git_util.bump_version(version, bump_type)
+    success, message, _ = git_util.create_tag(new_version, args.message)
+
+    if not success:
+        print(f"Error: {message}", file=sys.stderr)
+        sys.exit(1)
+    print(message)
+
+    if args.push:
+        # The tag just created is annotated, so --follow-tags carries it
+        success, message = git_util.push_changes(
+            remote=args.remote,
+            push_tags=True,
+            use_follow_tags=True
+        )
+        if not success:
+            print(f"Error: {message}", file=sys.stderr)
+            sys.exit(1)
+        print(message)
+
+
+def _cmd_push(git_util, args):
+    """Handle the push command."""
+    success, message = git_util.push_changes(
+        remote=args.remote,
+        branch=args.branch,
+        push_tags=args.tags
+    )
+
+    if not success:
+        print(f"Error: {message}", file=sys.stderr)
+        sys.exit(1)
+    print(message)
+
+
+# O(1) dispatch from command name to handler
+HANDLERS = {
+    "add": _cmd_add,
+    "commit": _cmd_commit,
+    "tag": _cmd_tag,
+    "push": _cmd_push,
+}
+
+
+def main():
+    """Main CLI entry point."""
+    argv = sys.argv[1:]
+
+    if len(argv) == 1 and argv[0] in _BARE_DEFAULTS:
+        # Fastest path: nothing to parse
+        parser = None
+        args = argparse.Namespace(command=argv[0], **_BARE_DEFAULTS[argv[0]])
+    else:
+        if argv and argv[0] in COMMANDS:
+            # Fast path: only register the command actually being run
+            parser = _build_command_parser(argv[0])
+        else:
+            # --help, no command, or unknown command
+            parser = _build_full_parser()
+        args = parser.parse_args()
+
     if not args.command:
         parser.print_help()
         sys.exit(1)
-    
+
+    from .git_operations import GitUtil
+
     git_util = GitUtil()
-    
+
     try:
-        if args.command == "add":
-            files = args.files if args.files else None
-            success, message = git_util.add_files(files)
-            print(message)
-            sys.exit(0 if success else 1)
-            
-        elif args.command == "commit":
-            # Add files if specified
-            files = args.files if hasattr(args, 'files') and args.files else None
-            if files is not None or (hasattr(args, 'files') and args.files is not None):
-                success, message = git_util.add_files(files)
-                if not success:
-                    print(f"Error: {message}", file=sys.stderr)
-                    sys.exit(1)
-                print(message)
-            
-            # Create commit
-            commit_type = CommitType(args.type)
-            success, message = git_util.create_conventional_commit(
-                commit_type=commit_type,
-                description=args.description,
-                scope=args.scope,
-                body=args.body,
-                breaking=args.breaking,
-                footer=args.footer
-            )
-            
-            if not success:
-                print(f"Error: {message}", file=sys.stderr)
-                sys.exit(1)
-            print(message)
-            
-            # Create tag if requested
-            if args.tag:
-                bump_type = VersionBump(args.tag)
-                success, message = git_util.auto_tag_and_push(
-                    bump_type=bump_type,
-                    remote=args.remote,
-                    branch=args.branch,
-                    tag_message=args.description
-                )
-                if not success:
-                    print(f"Error: {message}", file=sys.stderr)
-                    sys.exit(1)
-                print(message)
-            elif args.push:
-                # Push without tag
-                success, message = git_util.push_changes(
-                    remote=args.remote,
-                    branch=args.branch,
-                    push_tags=False
-                )
-                if not success:
-                    print(f"Error: {message}", file=sys.stderr)
-                    sys.exit(1)
-                print(message)
-                
-        elif args.command == "tag":
-            bump_type = VersionBump(args.bump)
-            
-            # Get latest tag and bump version
-            latest_tag = git_util.get_latest_tag()
-            if latest_tag:
-                version = git_util.parse_version(latest_tag)
-                if not version:
-                    print(f"Error: Failed to parse version from tag: {latest_tag}", file=sys.stderr)
-                    sys.exit(1)
-            else:
-                version = (0, 0, 0)
-            
-            new_version = git_util.bump_version(version, bump_type)
-            success, message = git_util.create_tag(new_version, args.message)
-            
-            if not success:
-                print(f"Error: {message}", file=sys.stderr)
-                sys.exit(1)
-            print(message)
-            
-            if args.push:
-                success, message = git_util.push_changes(
-                    remote=args.remote,
-                    push_tags=True
-                )
-                if not success:
-                    print(f"Error: {message}", file=sys.stderr)
-                    sys.exit(1)
-                print(message)
-                
-        elif args.command == "push":
-            success, message = git_util.push_changes(
-                remote=args.remote,
-                branch=args.branch,
-                push_tags=args.tags
-            )
-            
-            if not success:
-                print(f"Error: {message}", file=sys.stderr)
-                sys.exit(1)
-            print(message)
-            
+        HANDLERS[args.command](git_util, args)
     except KeyboardInterrupt:
         print("\nOperation cancelled by user", file=sys.stderr)
         sys.exit(1)
@@ -1,10 +1,63 @@
 """Core git operations with conventional commits and semantic versioning."""
 
+import functools
+import os
+import shutil
 import subprocess
 import re
-from typing import Optional, List, Tuple
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Tuple, Union
 from enum import Enum
 
+try:
+    import pygit2  # optional in-process backend (libgit2)
+except ImportError:
+    pygit2 = None
+
+# Resolved once at import: CPython's subprocess only takes its
+# posix_spawn fast path (no fork page-table copy) when the executable
+# already has a directory component, so hand it the full path
+_GIT = shutil.which("git") or "git"
+
+# Compiled once at import; parse_version sits on the tag-resolution
+# hot path and shouldn't pay re's pattern-cache lookup per call.
+# Each number is a single deterministic alternation ([1-9]\d* first,
+# the common case) and the pattern is used with fullmatch, so there is
+# no backtracking and no partial match on trailing garbage. The [-+]
+# tail tolerates pre-release/build metadata without capturing it.
+_SEMVER_RE = re.compile(r"([1-9]\d*|0)\.([1-9]\d*|0)\.([1-9]\d*|0)(?:[-+].*)?")
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_version(tag: str) -> Optional[Tuple[int, int, int]]:
+    """
+    Parse a semantic version tag into (major, minor, patch).
+
+    Module-level so lru_cache keys on the tag string alone and the
+    cache is shared by every GitUtil instance; parsing is pure, so
+    repeated lookups of the same tag cost a dict hit.
+    """
+    # Remove 'v' prefix if present
+    version_str = tag.lstrip("v")
+
+    # Optimistic fast path: tags this tool creates are plain
+    # X.Y.Z (optionally with -pre/+build on the patch), which
+    # split + int handle without starting the regex engine
+    parts = version_str.split(".", 3)
+    if len(parts) >= 3:
+        major, minor = parts[0], parts[1]
+        patch = parts[2].split("-", 1)[0].split("+", 1)[0]
+        if major.isdigit() and minor.isdigit() and patch.isdigit():
+            return int(major), int(minor), int(patch)
+
+    # Fall back to the regex for anything unusual
+    match = _SEMVER_RE.fullmatch(version_str)
+    if match:
+        return int(match.group(1)), int(match.group(2)), int(match.group(3))
+    return None
+
 
 class CommitType(Enum):
     """Conventional commit types."""
@@ -27,66 +80,198 @@ class VersionBump(Enum):
     PATCH = "patch"  # Bug fixes (0.0.X)
 
 
+# The enums are closed sets; resolve member -> string once instead of
+# going through Enum's .value descriptor on every commit
+_TYPE_STR = {t: t.value for t in CommitType}
+
+
 class GitUtil:
     """Git utility for conventional commits and semantic versioning."""
 
-    def __init__(self, repo_path: str = "."):
+    def __init__(
+        self,
+        repo_path: str = ".",
+        backend: Optional[str] = None,
+        dry_run: bool = False
+    ):
         """
         Initialize GitUtil.
-        
+
         Args:
             repo_path: Path to git repository (default: current directory)
+            backend: "pygit2" to serve tag listing and tag creation
+                in-process through libgit2 (no fork/exec per call).
+                Anything unavailable falls back to subprocess git, so
+                the flag is safe to pass unconditionally. Push always
+                shells out: the git binary handles credential helpers
+                and ssh config that libgit2 callbacks would reimplement.
+            dry_run: Record git commands instead of running them.
+                Each would-be invocation's arguments are appended to
+                executed_commands and reported as succeeding with
+                empty output. Lets tests and preview tooling assert on
+                the plan without paying a subprocess per call.
         """
         self.repo_path = repo_path
+        # dry_run forces the subprocess paths so every command is recorded
+        self.backend = backend if (pygit2 is not None and not dry_run) else None
+        self.dry_run = dry_run
+        self.executed_commands: List[List[str]] = []
+        # False = not yet opened/loaded (None and [] are valid results)
+        self._pygit2_repo = False
+        self._tag_refs_cache = False
+        self._tag_refs_lock = threading.Lock()
+        self._current_branch_cache = False
 
-    def _run_git_command(self, args: List[str]) -> Tuple[bool, str, str]:
+    def _run_git_command(self, args: List[str]) -> Tuple[bool, bytes, bytes]:
         """
         Run a git command.
-        
+
+        Output is returned as raw bytes: most callers only branch on
+        success, so decoding both streams eagerly (text=True) was a
+        per-call cost for nothing. Decode with _text at the point
+        where output is actually formatted for the user.
+
+        The invocation is shaped to keep CPython's posix_spawn fast
+        path (skipping fork's page-table copy): absolute git path,
+        close_fds left off, and `git -C` instead of cwd=, all of which
+        the fast-path eligibility check in subprocess requires. Don't
+        add preexec_fn=, env=, or start_new_session= here.
+
         Args:
             args: Git command arguments
-            
+
         Returns:
-            Tuple of (success, stdout, stderr)
+            Tuple of (success, stdout bytes, stderr bytes)
         """
+        if self.dry_run:
+            self.executed_commands.append(list(args))
+            return True, b"", b""
         try:
             result = subprocess.run(
-                ["git"] + args,
-                cwd=self.repo_path,
+                (_GIT, "-C", self.repo_path, *args),
                 capture_output=True,
-                text=True,
-                check=False
+                check=False,
+                close_fds=False
             )
             success = result.returncode == 0
             return success, result.stdout, result.stderr
         except Exception as e:
-            return False, "", str(e)
+            return False, b"", str(e).encode()
+
+    def _run_git_stream(self, args: List[str]):
+        """
+        Run a git command, yielding stdout lines (bytes) as they arrive.
+
+        Unlike _run_git_command, which buffers the whole output before
+        returning, this streams: first-line processing starts as soon
+        as git writes it, and memory stays flat however large the
+        output grows. Intended for log/diff-scale commands. Breaking
+        out of the loop early terminates git rather than draining it,
+        so scans can stop at the first interesting line. In dry-run
+        mode the argv is recorded like any other command and nothing
+        is yielded.
+
+        Args:
+            args: Git command arguments
+
+        Yields:
+            Raw stdout lines, newline included
+        """
+        if self.dry_run:
+            self.executed_commands.append(list(args))
+            return
+        proc = subprocess.Popen(
+            (_GIT, "-C", self.repo_path, *args),
+            stdout=subprocess.PIPE,
+            close_fds=False,
+        )
+        try:
+            yield from iter(proc.stdout.readline, b"")
+        finally:
+            proc.stdout.close()
+            if proc.poll() is None:
+                proc.terminate()
+            proc.wait()
+
+    @staticmethod
+    def _text(data: bytes) -> str:
+        """Decode git output for user-facing messages."""
+        return data.decode("utf-8", "replace")
+
+    # Above this many paths, stop passing them as argv (risking the
+    # kernel's ARG_MAX limit) and hand git a pathspec file instead
+    _ADD_BATCH = 500
 
     def add_files(self, files: Optional[List[str]] = None) -> Tuple[bool, str]:
         """
         Add files to git staging area.
-        
+
         Args:
             files: List of files to add (None means add all)
-            
+
         Returns:
             Tuple of (success, message)
         """
+        if files is not None and len(files) > self._ADD_BATCH:
+            return self._add_files_batched(files)
+
         if files is None:
             args = ["add", "."]
         else:
             args = ["add"] + files
-            
+
         success, stdout, stderr = self._run_git_command(args)
-        
+
         if success:
             return True, f"Successfully added files to staging area"
         else:
-            return False, f"Failed to add files: {stderr}"
+            return False, f"Failed to add files: {self._text(stderr)}"
+
+    def _add_files_batched(self, files: List[str]) -> Tuple[bool, str]:
+        """
+        Stage a large file list without blowing argv limits.
+
+        Writes the paths NUL-separated to a temp file and stages them
+        with one `git add --pathspec-from-file`; if this git is too
+        old for that option, falls back to sequential adds in
+        _ADD_BATCH-sized argv chunks.
+
+        Args:
+            files: List of files to add
+
+        Returns:
+            Tuple of (success, message)
+        """
+        tmp = tempfile.NamedTemporaryFile("w", delete=False)
+        try:
+            tmp.write("\0".join(files))
+            tmp.close()
+            success, stdout, stderr = self._run_git_command([
+                "add",
+                "--pathspec-from-file=" + tmp.name,
+                "--pathspec-file-nul"
+            ])
+        finally:
+            os.unlink(tmp.name)
+
+        if not success and b"pathspec-from-file" in stderr:
+            # git < 2.25: chunked argv adds
+            for i in range(0, len(files), self._ADD_BATCH):
+                success, stdout, stderr = self._run_git_command(
+                    ["add"] + files[i:i + self._ADD_BATCH]
+                )
+                if not success:
+                    return False, f"Failed to add files: {self._text(stderr)}"
+            return True, f"Successfully added files to staging area"
+
+        if success:
+            return True, f"Successfully added files to staging area"
+        else:
+            return False, f"Failed to add files: {self._text(stderr)}"
 
     def create_conventional_commit(
         self,
-        commit_type: CommitType,
+        commit_type: Union[CommitType, str],
         description: str,
         scope: Optional[str] = None,
         body: Optional[str] = None,
@@ -97,7 +282,9 @@ class GitUtil:
         Create a conventional commit.
         
         Args:
-            commit_type: Type of commit (feat, fix, etc.)
+            commit_type: Type of commit -- a CommitType member, or its
+                string value ("feat", "fix", ...) to skip the Enum
+                machinery entirely on hot paths
             description: Short description of changes
             scope: Optional scope of changes
             body: Optional detailed description
@@ -107,63 +294,134 @@ class GitUtil:
         Returns:
             Tuple of (success, message)
         """
-        # Build commit message
-        type_str = commit_type.value
-        scope_str = f"({scope})" if scope else ""
-        breaking_str = "!" if breaking else ""
-        
-        commit_msg = f"{type_str}{scope_str}{breaking_str}: {description}"
-        
+        # Build commit message in one pass: collect parts, join once,
+        # instead of growing a string with repeated concatenation
+        parts = [_TYPE_STR.get(commit_type, commit_type)]
+        if scope:
+            parts.append(f"({scope})")
+        if breaking:
+            parts.append("!")
+        parts.append(f": {description}")
+
         if body:
-            commit_msg += f"\n\n{body}"
-            
-        if breaking and not body:
-            commit_msg += "\n\nBREAKING CHANGE: This commit contains breaking changes"
-            
+            parts.append(f"\n\n{body}")
+        elif breaking:
+            parts.append("\n\nBREAKING CHANGE: This commit contains breaking changes")
+
         if footer:
-            commit_msg += f"\n\n{footer}"
-            
+            parts.append(f"\n\n{footer}")
+
+        commit_msg = "".join(parts)
+
         # Create commit
         success, stdout, stderr = self._run_git_command(["commit", "-m", commit_msg])
         
         if success:
             return True, f"Successfully created commit: {commit_msg.split(chr(10))[0]}"
         else:
-            return False, f"Failed to create commit: {stderr}"
+            return False, f"Failed to create commit: {self._text(stderr)}"
+
+    def _pygit2_repository(self):
+        """Open and cache the libgit2 repository handle, or None."""
+        if self._pygit2_repo is False:
+            try:
+                self._pygit2_repo = pygit2.Repository(self.repo_path)
+            except Exception:
+                self._pygit2_repo = None
+        return self._pygit2_repo
 
-    def get_latest_tag(self) -> Optional[str]:
+    def _tag_refs_pygit2(self) -> Optional[List[str]]:
+        """
+        List tags in-process via libgit2, or None if unavailable.
+
+        Sorted to match the subprocess path's -v:refname ordering;
+        anything that doesn't parse as a version sorts last.
+        """
+        repo = self._pygit2_repository()
+        if repo is None:
+            return None
+        prefix = "refs/tags/"
+        names = [ref[len(prefix):] for ref in repo.references
+                 if ref.startswith(prefix)]
+        names.sort(key=lambda name: _parse_version(name) or (-1, -1, -1),
+                   reverse=True)
+        return names
+
+    def _tag_refs(self) -> List[str]:
+        """
+        All tag names, version-sorted newest first.
+
+        Loaded lazily and cached on the instance, so any number of tag
+        lookups in a workflow cost one read -- via libgit2 when the
+        pygit2 backend is active (no subprocess at all), otherwise a
+        single `git for-each-ref`. A lock guards the load so
+        concurrent callers populate it once. Invalidated when
+        create_tag succeeds.
+
+        Returns:
+            List of tag names, newest version first
+        """
+        with self._tag_refs_lock:
+            if self._tag_refs_cache is False:
+                tags = None
+                if self.backend == "pygit2":
+                    tags = self._tag_refs_pygit2()
+                if tags is None:
+                    success, stdout, stderr = self._run_git_command(
+                        ["for-each-ref", "--sort=-v:refname",
+                         "--format=%(refname:short)", "refs/tags"]
+                    )
+                    tags = (
+                        [tag.decode("utf-8", "replace") for tag in stdout.split()]
+                        if success else []
+                    )
+                self._tag_refs_cache = tags
+            return self._tag_refs_cache
+
+    def get_latest_tag(self, reachable_only: bool = False) -> Optional[str]:
         """
         Get the latest semantic version tag.
-        
+
+        Served from the cached tag list; git's v:refname sort already
+        orders versions correctly, and reading refs is O(tags) where
+        the old `git describe` form walked history from HEAD
+        (O(commits)). Version tags (the "v" prefix this tool creates)
+        win over anything else in the ref list.
+
+        Args:
+            reachable_only: True restores the describe behavior --
+                nearest tag reachable from HEAD, at history-walk cost
+
         Returns:
             Latest tag or None if no tags exist
         """
-        success, stdout, stderr = self._run_git_command(
-            ["describe", "--tags", "--abbrev=0"]
-        )
-        
-        if success and stdout.strip():
-            return stdout.strip()
-        return None
+        if reachable_only:
+            success, stdout, stderr = self._run_git_command(
+                ["describe", "--tags", "--abbrev=0"]
+            )
+            return self._text(stdout).strip() if success else None
+
+        tags = self._tag_refs()
+        for tag in tags:
+            if tag.startswith("v"):
+                return tag
+        return tags[0] if tags else None
 
     def parse_version(self, tag: str) -> Optional[Tuple[int, int, int]]:
         """
         Parse semantic version from tag.
-        
+
+        Pure and memoized: loops that re-parse the same tag strings
+        (release workflows, run_on_repos) hit the cache after the
+        first call. Use _parse_version.cache_clear() in tests.
+
         Args:
             tag: Version tag (e.g., "v1.2.3" or "1.2.3")
-            
+
         Returns:
             Tuple of (major, minor, patch) or None if invalid
         """
-        # Remove 'v' prefix if present
-        version_str = tag.lstrip("v")
-        
-        # Parse version
-        match = re.match(r"^(\d+)\.(\d+)\.(\d+)", version_str)
-        if match:
-            return int(match.group(1)), int(match.group(2)), int(match.group(3))
-        return None
+        return _parse_version(tag)
 
     def bump_version(
         self,
@@ -189,73 +447,166 @@ class GitUtil:
         else:  # PATCH
             return major, minor, patch + 1
 
+    def _create_tag_pygit2(
+        self,
+        tag_name: str,
+        message: Optional[str]
+    ) -> Optional[Tuple[bool, str]]:
+        """
+        Create an annotated tag in-process via libgit2.
+
+        Returns None when the repository can't be opened (caller falls
+        back to subprocess git), otherwise (success, error text).
+        """
+        repo = self._pygit2_repository()
+        if repo is None:
+            return None
+        # Constant renamed between pygit2 releases
+        commit_type = getattr(pygit2, "GIT_OBJECT_COMMIT",
+                              getattr(pygit2, "GIT_OBJ_COMMIT", None))
+        try:
+            repo.create_tag(
+                tag_name,
+                repo.head.target,
+                commit_type,
+                repo.default_signature,
+                message if message else tag_name,
+            )
+        except Exception as e:
+            return False, str(e)
+        return True, ""
+
     def create_tag(
         self,
         version: Tuple[int, int, int],
         message: Optional[str] = None,
         prefix: str = "v"
-    ) -> Tuple[bool, str]:
+    ) -> Tuple[bool, str, str]:
         """
         Create a git tag with semantic version.
-        
+
         Args:
             version: Version tuple (major, minor, patch)
-            message: Optional tag message
+            message: Optional tag message (defaults to the tag name)
             prefix: Tag prefix (default: "v")
-            
+
         Returns:
-            Tuple of (success, message)
+            Tuple of (success, message, tag name), so callers can reuse
+            the formatted tag name instead of rebuilding it
         """
         tag_name = f"{prefix}{version[0]}.{version[1]}.{version[2]}"
-        
-        if message:
-            args = ["tag", "-a", tag_name, "-m", message]
-        else:
-            args = ["tag", tag_name]
-            
+
+        if self.backend == "pygit2":
+            created = self._create_tag_pygit2(tag_name, message)
+            if created is not None:
+                success, error = created
+                if success:
+                    self._tag_refs_cache = False  # new tag changes the answer
+                    return True, f"Successfully created tag: {tag_name}", tag_name
+                return False, f"Failed to create tag: {error}", tag_name
+
+        # Always annotate: push --follow-tags only transports
+        # annotated tags, and an unannotated release tag carries no
+        # author/date metadata anyway
+        args = ["tag", "-a", tag_name, "-m", message if message else tag_name]
+
         success, stdout, stderr = self._run_git_command(args)
-        
+
         if success:
-            return True, f"Successfully created tag: {tag_name}"
+            self._tag_refs_cache = False  # new tag changes the answer
+            return True, f"Successfully created tag: {tag_name}", tag_name
         else:
-            return False, f"Failed to create tag: {stderr}"
+            return False, f"Failed to create tag: {self._text(stderr)}", tag_name
+
+    def current_branch(self) -> Optional[str]:
+        """
+        Name of the checked-out branch, read once and cached.
+
+        One `git symbolic-ref --short HEAD` on first use; pushes in
+        the same workflow reuse the answer. A future checkout/switch
+        method must reset _current_branch_cache. Returns None on a
+        detached HEAD.
+
+        Returns:
+            Branch name, or None if HEAD is detached
+        """
+        if self._current_branch_cache is False:
+            success, stdout, stderr = self._run_git_command(
+                ["symbolic-ref", "--short", "HEAD"]
+            )
+            self._current_branch_cache = (
+                self._text(stdout).strip() or None if success else None
+            )
+        return self._current_branch_cache
 
     def push_changes(
         self,
         remote: str = "origin",
         branch: Optional[str] = None,
-        push_tags: bool = False
+        push_tags: bool = False,
+        use_follow_tags: bool = False,
+        atomic: bool = False
     ) -> Tuple[bool, str]:
         """
         Push changes to remote repository.
-        
+
         Args:
             remote: Remote name (default: "origin")
-            branch: Branch name (None means current branch)
+            branch: Branch name (None means the current branch,
+                resolved once via current_branch and passed to git as
+                an explicit refspec so it skips HEAD resolution)
             push_tags: Whether to push tags
-            
+            use_follow_tags: When pushing tags, send branch and
+                annotated tags in one `git push --follow-tags` (one
+                subprocess and one network round trip). Off by
+                default because --follow-tags silently skips
+                lightweight tags; the release paths opt in, since
+                create_tag always annotates.
+            atomic: Ask the server to update all refs in one
+                transaction (`push --atomic`): either branch and tags
+                all land or none do, so a partial failure never needs
+                a cleanup push.
+
         Returns:
             Tuple of (success, message)
         """
+        if branch is None:
+            # None on detached HEAD, which leaves the old behavior of
+            # letting git decide what to push
+            branch = self.current_branch()
+
+        if push_tags and use_follow_tags:
+            args = ["push", "--follow-tags", remote]
+            if atomic:
+                args.insert(1, "--atomic")
+            if branch:
+                args.append(branch)
+            success, stdout, stderr = self._run_git_command(args)
+            if success:
+                return True, f"Successfully pushed changes to {remote} (including tags)"
+            return False, f"Failed to push changes: {self._text(stderr)}"
+
         if branch:
             args = ["push", remote, branch]
         else:
             args = ["push", remote]
-            
+        if atomic:
+            args.insert(1, "--atomic")
+
         success, stdout, stderr = self._run_git_command(args)
-        
+
         if not success:
-            return False, f"Failed to push changes: {stderr}"
-            
+            return False, f"Failed to push changes: {self._text(stderr)}"
+
         message = f"Successfully pushed changes to {remote}"
-        
+
         if push_tags:
             success, stdout, stderr = self._run_git_command(["push", remote, "--tags"])
             if success:
                 message += " (including tags)"
             else:
-                return False, f"Failed to push tags: {stderr}"
-                
+                return False, f"Failed to push tags: {self._text(stderr)}"
+
         return True, message
 
     def auto_tag_and_push(
@@ -267,7 +618,12 @@ class GitUtil:
     ) -> Tuple[bool, str]:
         """
         Automatically create a tag based on version bump and push.
-        
+
+        Branch and tag go out in a single atomic follow-tags push: one
+        network round trip, and the server applies all ref updates in
+        one transaction, so a failure leaves nothing half-pushed to
+        clean up.
+
         Args:
             bump_type: Type of version bump
             remote: Remote name
@@ -291,16 +647,40 @@ class GitUtil:
         # Bump version
         new_version = self.bump_version(version, bump_type)
         
-        # Create tag
-        success, msg = self.create_tag(new_version, tag_message)
+        # Create tag; reuse the tag name it already formatted
+        success, msg, tag_name = self.create_tag(new_version, tag_message)
         if not success:
             return False, msg
-            
-        # Push changes with tags
-        success, msg = self.push_changes(remote, branch, push_tags=True)
-        
-        tag_name = f"v{new_version[0]}.{new_version[1]}.{new_version[2]}"
+
+        # Push branch and tag together, transactionally; the tag just
+        # created is annotated, so --follow-tags transports it
+        success, msg = self.push_changes(remote, branch, push_tags=True,
+                                         use_follow_tags=True, atomic=True)
+
         if success:
             return True, f"Successfully created tag {tag_name} and pushed to {remote}"
         else:
             return False, msg
+
+
+def run_on_repos(repo_paths: List[str], func, max_workers: int = 8) -> List:
+    """
+    Run an operation across several repositories in parallel.
+
+    Each path gets its own GitUtil, so per-instance caches stay
+    independent. subprocess waits release the GIL and git work is
+    process/IO-bound, so wall time scales close to linearly with
+    workers up to remote and network limits. For loops of SSH
+    pushes/fetches, enabling ControlMaster connection reuse in
+    ~/.ssh/config compounds the win.
+
+    Args:
+        repo_paths: Paths to git repositories
+        func: Callable invoked as func(GitUtil(path)) for each path
+        max_workers: Maximum concurrent workers (default: 8)
+
+    Returns:
+        List of func results, in repo_paths order
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lambda path: func(GitUtil(path)), repo_paths))
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+In-process tests for the git_util package.
+
+Mostly uses GitUtil(dry_run=True), which records commands instead of
+running them, so these tests rarely pay for a git subprocess.
+"""
+
+import unittest
+
+from git_util import GitUtil
+from git_util.git_operations import CommitType, VersionBump
+
+
+class TestGitOperations(unittest.TestCase):
+    """Test cases for GitUtil in dry-run mode"""
+
+    def setUp(self):
+        """Set up a recording GitUtil"""
+        self.git = GitUtil(dry_run=True)
+
+    def test_dry_run_records_commands(self):
+        """Test that dry-run records argv instead of running git"""
+        success, message = self.git.add_files(["a.py", "b.py"])
+        self.assertTrue(success)
+        self.assertEqual(self.git.executed_commands, [["add", "a.py", "b.py"]])
+
+    def test_parse_version(self):
+        """Test semantic version parsing"""
+        self.assertEqual(self.git.parse_version("v1.2.3"), (1, 2, 3))
+        self.assertEqual(self.git.parse_version("1.2.3"), (1, 2, 3))
+        self.assertEqual(self.git.parse_version("v1.2.3-rc.1"), (1, 2, 3))
+        self.assertIsNone(self.git.parse_version("not-a-version"))
+
+    def test_bump_version(self):
+        """Test version bumping"""
+        self.assertEqual(self.git.bump_version((1, 2, 3), VersionBump.MAJOR), (2, 0, 0))
+        self.assertEqual(self.git.bump_version((1, 2, 3), VersionBump.MINOR), (1, 3, 0))
+        self.assertEqual(self.git.bump_version((1, 2, 3), VersionBump.PATCH), (1, 2, 4))
+
+    def test_conventional_commit_message(self):
+        """Test the assembled conventional commit message"""
+        success, message = self.git.create_conventional_commit(
+            CommitType.FEAT, "add login", scope="auth", breaking=True
+        )
+        self.assertTrue(success)
+        args = self.git.executed_commands[-1]
+        self.assertEqual(args[:2], ["commit", "-m"])
+        self.assertTrue(args[2].startswith("feat(auth)!: add login"))
+        self.assertIn("BREAKING CHANGE", args[2])
+
+    def test_create_tag(self):
+        """Test annotated tag creation arguments"""
+        success, message, tag_name = self.git.create_tag((1, 2, 3))
+        self.assertTrue(success)
+        self.assertEqual(tag_name, "v1.2.3")
+        self.assertEqual(
+            self.git.executed_commands[-1],
+            ["tag", "-a", "v1.2.3", "-m", "v1.2.3"]
+        )
+
+    def test_push_with_tags_keeps_push_tags_semantics(self):
+        """Test that the default tagged push still runs git push --tags"""
+        success, message = self.git.push_changes(
+            branch="main", push_tags=True
+        )
+        self.assertTrue(success)
+        self.assertEqual(
+            self.git.executed_commands,
+            [["push", "origin", "main"], ["push", "origin", "--tags"]]
+        )
+
+    def test_follow_tags_push_is_single_command(self):
+        """Test that opting into follow-tags issues one command"""
+        success, message = self.git.push_changes(
+            branch="main", push_tags=True, use_follow_tags=True
+        )
+        self.assertTrue(success)
+        self.assertEqual(
+            self.git.executed_commands,
+            [["push", "--follow-tags", "origin", "main"]]
+        )
+
+    def test_get_latest_tag_without_tags(self):
+        """Test latest-tag lookup when no tags exist"""
+        self.assertIsNone(self.git.get_latest_tag())
+
+    def test_stream_honors_dry_run(self):
+        """Test that streaming records argv and yields nothing in dry-run"""
+        lines = list(self.git._run_git_stream(["log", "--oneline"]))
+        self.assertEqual(lines, [])
+        self.assertEqual(self.git.executed_commands, [["log", "--oneline"]])
+
+
+class TestGitStream(unittest.TestCase):
+    """Test cases for the streaming runner against a real git"""
+
+    def test_stream_early_termination(self):
+        """Test that breaking out of the stream cleans up git"""
+        git = GitUtil()
+        stream = git._run_git_stream(["log", "--oneline"])
+        first = next(stream)
+        self.assertTrue(first.endswith(b"\n"))
+        stream.close()  # triggers the terminate/reap cleanup path
+
+
+if __name__ == "__main__":
+    unittest.main()